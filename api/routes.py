@@ -1,5 +1,7 @@
 from flask import Blueprint, request, jsonify, current_app, Response
+import hashlib
 import io
+import logging
 import uuid
 import time
 import zipfile
@@ -13,17 +15,17 @@ import queue
 from api.services.whisper_functions import (
     process_pure_tamil_from_audio,
     transcribe_with_whisper,
-    batch_transcribe_multiple_languages,
     get_whisper_model
 )
 from api.services.audio_service import extract_audio_from_video, convert_audio_format, split_audio
 from api.services.translation_service import translate_text
 from api.services.tanglish_service import tamil_to_tanglish, contains_tamil_script
-from api.services.srt_service import generate_all_srt_files_improved
 from utils.file_utils import allowed_file
 
 api_bp = Blueprint('api', __name__)
 
+logger = logging.getLogger(__name__)
+
 # In-memory storage for processing results and files
 processing_status = {}
 processing_results = {}  # upload_id -> {'results': {...}, 'files': {...}}
@@ -53,19 +55,23 @@ class InMemoryFileManager:
             content = data.read()
             data = io.BytesIO(content)
         
-        file_size = len(data.getvalue())
-        
+        content = data.getvalue()
+        file_size = len(content)
+
         # Check if we need to cleanup old files
         if self.total_size + file_size > self.max_size:
             self._cleanup_old_files()
-        
+
         if upload_id not in self.files:
             self.files[upload_id] = {}
-        
+
         self.files[upload_id][filename] = {
             'data': data,
             'timestamp': time.time(),
-            'size': file_size
+            'size': file_size,
+            # ETag computed once at write time so download routes can
+            # answer conditional requests without re-hashing the body
+            'etag': '"%s"' % hashlib.blake2b(content, digest_size=8).hexdigest()
         }
         self.total_size += file_size
         
@@ -78,6 +84,12 @@ class InMemoryFileManager:
             file_info['data'].seek(0)  # Reset to beginning
             return file_info['data']
         return None
+
+    def get_entry(self, upload_id, filename):
+        """Retrieve the full stored record (data, size, etag) or None"""
+        if upload_id in self.files and filename in self.files[upload_id]:
+            return self.files[upload_id][filename]
+        return None
     
     def list_files(self, upload_id):
         """List all files for an upload"""
@@ -95,19 +107,31 @@ class InMemoryFileManager:
     def _cleanup_old_files(self):
         """Remove old files to free up memory"""
         current_time = time.time()
-        uploads_to_remove = []
-        
-        for upload_id, files in self.files.items():
+        removed = 0
+
+        # Single pass: evaluate and evict together (the list() copy
+        # allows deleting while iterating)
+        for upload_id, files in list(self.files.items()):
+            if upload_id in active_uploads:
+                continue
             upload_age = min(file_info['timestamp'] for file_info in files.values())
             if current_time - upload_age > CACHE_EXPIRY:
-                uploads_to_remove.append(upload_id)
-        
-        for upload_id in uploads_to_remove:
-            self.delete_upload(upload_id)
+                self.delete_upload(upload_id)
+                removed += 1
+
+        if removed:
+            # Lazy %-formatting: nothing is built when the level is off
+            logger.info("Evicted %d expired upload(s) from memory", removed)
 
 # Global file manager instance
 file_manager = InMemoryFileManager()
 
+# Uploads currently being processed - the cleanup sweeps skip these so
+# a long transcription can't have its files evicted mid-run. A plain
+# set lookup, no filesystem markers involved.
+active_uploads = set()
+_active_uploads_lock = threading.Lock()
+
 def broadcast_status_update(upload_id, status_data):
     """Broadcast status update to all SSE clients for this upload_id"""
     processing_status[upload_id] = status_data
@@ -142,7 +166,10 @@ def process_video_streaming(upload_id, file_data, filename, app):
     """Process video entirely in memory with streaming results"""
     with app.app_context():
         temp_files = []  # Keep track for cleanup
-        
+
+        with _active_uploads_lock:
+            active_uploads.add(upload_id)
+
         try:
             broadcast_status_update(upload_id, {
                 'status': 'processing', 
@@ -231,18 +258,24 @@ def process_video_streaming(upload_id, file_data, filename, app):
                 else:
                     tanglish_english_text = "Tamil transcription failed"
                 
-                # Step 7: English transcription
+                # Step 7: English text
                 broadcast_status_update(upload_id, {
                     'status': 'processing',
                     'progress': 65,
                     'message': 'Generating English translation...'
                 })
-                
-                try:
-                    english_text = transcribe_with_whisper(wav_path, language="en")
-                except Exception as e:
-                    print(f"English transcription failed: {e}")
-                    english_text = translate_text(tanglish_tamil_text, "ta", "en") if tanglish_tamil_text else ""
+
+                # Whisper already ran once for Tamil; derive English by
+                # translating that transcript instead of a second ASR pass.
+                # Fall back to Whisper only when there is no Tamil text.
+                if tanglish_tamil_text:
+                    english_text = translate_text(tanglish_tamil_text, "ta", "en")
+                else:
+                    try:
+                        english_text = transcribe_with_whisper(wav_path, language="en")
+                    except Exception as e:
+                        print(f"English transcription failed: {e}")
+                        english_text = ""
                 
                 # Step 8: Standard Tamil translation
                 broadcast_status_update(upload_id, {
@@ -362,13 +395,16 @@ TAMIL TEXT (FROM ENGLISH):
             traceback.print_exc()
         
         finally:
+            with _active_uploads_lock:
+                active_uploads.discard(upload_id)
+
             # Clean up temporary files
             for temp_file in temp_files:
                 try:
                     if os.path.exists(temp_file):
                         os.unlink(temp_file)
                 except Exception as e:
-                    print(f"Cleanup error: {e}")
+                    logger.warning("Cleanup error: %s", e)
 
 @api_bp.route('/upload', methods=['POST'])
 def upload_video():
@@ -455,16 +491,22 @@ def get_processing_status(upload_id):
 @api_bp.route('/download/<upload_id>', methods=['GET'])
 def download_results(upload_id):
     """Download results text file from memory"""
-    file_data = file_manager.get_file(upload_id, "results.txt")
-    
-    if not file_data:
+    entry = file_manager.get_entry(upload_id, "results.txt")
+
+    if not entry:
         return jsonify({'error': 'Results file not found'}), 404
-    
+
+    # Conditional request: the ETag was computed at store time, so a
+    # repeat download costs a string compare instead of a body send
+    if request.headers.get('If-None-Match') == entry['etag']:
+        return Response(status=304, headers={'ETag': entry['etag']})
+
     return Response(
-        file_data.getvalue(),
+        entry['data'].getvalue(),
         mimetype='text/plain',
         headers={
-            'Content-Disposition': 'attachment; filename=tamil_transcription_results.txt'
+            'Content-Disposition': 'attachment; filename=tamil_transcription_results.txt',
+            'ETag': entry['etag']
         }
     )
 
@@ -482,16 +524,20 @@ def download_srt(upload_id, srt_type):
         return jsonify({'error': 'Invalid SRT type'}), 400
     
     filename = srt_filenames[srt_type]
-    file_data = file_manager.get_file(upload_id, filename)
-    
-    if not file_data:
+    entry = file_manager.get_entry(upload_id, filename)
+
+    if not entry:
         return jsonify({'error': f'{srt_type.title()} SRT file not found'}), 404
-    
+
+    if request.headers.get('If-None-Match') == entry['etag']:
+        return Response(status=304, headers={'ETag': entry['etag']})
+
     return Response(
-        file_data.getvalue(),
+        entry['data'].getvalue(),
         mimetype='application/x-subrip',
         headers={
-            'Content-Disposition': f'attachment; filename={filename}'
+            'Content-Disposition': f'attachment; filename={filename}',
+            'ETag': entry['etag']
         }
     )
 
@@ -577,33 +623,62 @@ def cleanup(upload_id):
         'message': 'Upload data cleaned up successfully'
     })
 
+# Set to stop the cleanup thread promptly (e.g. on SIGTERM) instead of
+# waiting out the remainder of a five-minute sleep
+cleanup_stop_event = threading.Event()
+
+def purge_expired_uploads():
+    """Expire uploads across every store in one pass
+
+    Collects the expired ids from the file cache and the results dict
+    together, then removes each upload from all four stores at once -
+    one sweep instead of separate per-store passes that could disagree
+    about which uploads are stale.
+    """
+    current_time = time.time()
+    expired = set()
+
+    # list() snapshots: worker threads insert into these dicts while the
+    # sweep runs, and a resize mid-iteration raises RuntimeError
+    for upload_id, files in list(file_manager.files.items()):
+        if upload_id in active_uploads:
+            continue
+        upload_age = min(file_info['timestamp'] for file_info in files.values())
+        if current_time - upload_age > CACHE_EXPIRY:
+            expired.add(upload_id)
+
+    for upload_id, result_data in list(processing_results.items()):
+        if upload_id in active_uploads:
+            continue
+        if current_time - result_data.get('timestamp', 0) > CACHE_EXPIRY:
+            expired.add(upload_id)
+
+    for upload_id in expired:
+        file_manager.delete_upload(upload_id)
+        processing_status.pop(upload_id, None)
+        processing_results.pop(upload_id, None)
+        sse_clients.pop(upload_id, None)
+
+    if expired:
+        logger.info("Evicted %d expired upload(s)", len(expired))
+
 # Periodic cleanup task
+CLEANUP_INTERVAL = 300  # 5 minutes
+
 def periodic_cleanup():
-    """Clean up expired uploads periodically"""
-    while True:
+    """Clean up expired uploads periodically
+
+    Deadline-driven: each wait is sized to the next absolute tick, so a
+    slow sweep doesn't drift the schedule, and setting the stop event
+    ends the loop immediately.
+    """
+    next_run = time.monotonic() + CLEANUP_INTERVAL
+    while not cleanup_stop_event.wait(max(0, next_run - time.monotonic())):
         try:
-            file_manager._cleanup_old_files()
-            
-            # Clean up expired processing status
-            current_time = time.time()
-            expired_uploads = []
-            
-            for upload_id, result_data in processing_results.items():
-                if current_time - result_data.get('timestamp', 0) > CACHE_EXPIRY:
-                    expired_uploads.append(upload_id)
-            
-            for upload_id in expired_uploads:
-                if upload_id in processing_results:
-                    del processing_results[upload_id]
-                if upload_id in processing_status:
-                    del processing_status[upload_id]
-                if upload_id in sse_clients:
-                    del sse_clients[upload_id]
-            
+            purge_expired_uploads()
         except Exception as e:
-            print(f"Cleanup error: {e}")
-        
-        time.sleep(300)  # Run every 5 minutes
+            logger.warning("Cleanup error: %s", e)
+        next_run += CLEANUP_INTERVAL
 
 # Start cleanup thread
 cleanup_thread = threading.Thread(target=periodic_cleanup)
@@ -1,4 +1,6 @@
 import os
+import wave
+import numpy as np
 import moviepy.editor as mp
 from pydub import AudioSegment
 
@@ -39,27 +41,130 @@ def convert_audio_format(input_audio_path, output_audio_path):
 def split_audio(audio_path, chunk_length_ms=20000, output_dir=None):
     """
     Split audio into chunks to handle longer videos
-    
+
+    WAV input is sliced as a numpy view over the raw sample buffer, so
+    each chunk is cut without copying or constructing intermediate
+    AudioSegment objects. Other formats fall back to pydub.
+
     Args:
         audio_path (str): Path to the audio file
         chunk_length_ms (int): Length of each chunk in milliseconds
         output_dir (str): Directory to save the chunks
-    
+
     Returns:
         list: List of paths to the audio chunks
     """
-    audio = AudioSegment.from_file(audio_path)
-    chunks = []
-    
     # Get the directory to save chunks
     if output_dir is None:
         output_dir = os.path.dirname(audio_path)
-    
+
+    try:
+        with wave.open(audio_path, 'rb') as wav:
+            n_channels = wav.getnchannels()
+            sample_width = wav.getsampwidth()
+            frame_rate = wav.getframerate()
+            raw_frames = wav.readframes(wav.getnframes())
+        if sample_width != 2:
+            raise ValueError(f"Unsupported sample width: {sample_width}")
+    except (wave.Error, EOFError, ValueError):
+        # Non-WAV (or non-PCM16) input - fall back to pydub
+        return _split_audio_pydub(audio_path, chunk_length_ms, output_dir)
+
+    # Interleaved int16 samples; slicing this array yields zero-copy views
+    samples = np.frombuffer(raw_frames, dtype=np.int16)
+
+    # Prefer VAD-aligned chunks so boundaries fall in silence, not mid-word
+    if n_channels == 1 and frame_rate == 16000:
+        chunks = _split_audio_vad(samples, frame_rate, output_dir)
+        if chunks:
+            return chunks
+
+    samples_per_chunk = (chunk_length_ms * frame_rate // 1000) * n_channels
+
+    chunks = []
+    for chunk_index, i in enumerate(range(0, len(samples), samples_per_chunk)):
+        chunk_path = os.path.join(output_dir, f"chunk_{chunk_index}.wav")
+        _write_wav_chunk(chunk_path, samples[i:i + samples_per_chunk], frame_rate, n_channels)
+        chunks.append(chunk_path)
+
+    return chunks
+
+def _write_wav_chunk(chunk_path, samples, frame_rate, n_channels=1):
+    """Write an int16 sample buffer as a PCM WAV file"""
+    with wave.open(chunk_path, 'wb') as out:
+        out.setnchannels(n_channels)
+        out.setsampwidth(2)
+        out.setframerate(frame_rate)
+        out.writeframes(samples)
+
+def _split_audio_vad(samples, frame_rate, output_dir, max_chunk_s=30, overlap_s=1.0):
+    """
+    Split mono 16kHz samples at speech boundaries using Silero VAD
+
+    Speech regions are merged until a merged chunk would exceed
+    max_chunk_s, then padded with overlap_s of context on each side so
+    words at the boundary appear in both neighbouring chunks. Silence
+    between speech regions is never written out.
+
+    Returns:
+        list: Chunk paths, or [] if VAD is unavailable or finds no speech
+    """
+    try:
+        # Silero VAD ships with faster-whisper, so no extra dependency
+        from faster_whisper.vad import VadOptions, get_speech_timestamps
+
+        float_samples = samples.astype(np.float32) / 32768.0
+        # Bound individual speech regions: with the default (unlimited)
+        # max_speech_duration_s, continuous speech with short pauses
+        # comes back as one giant timestamp that the merge loop below
+        # can't split. The VAD then cuts at the last silence itself.
+        speech_timestamps = get_speech_timestamps(
+            float_samples, VadOptions(max_speech_duration_s=max_chunk_s))
+    except Exception as e:
+        print(f"VAD chunking unavailable, falling back to fixed chunks: {e}")
+        return []
+
+    if not speech_timestamps:
+        return []
+
+    # Merge consecutive speech regions up to max_chunk_s per chunk
+    max_samples = max_chunk_s * frame_rate
+    regions = []
+    region_start = region_end = None
+
+    for ts in speech_timestamps:
+        if region_start is None:
+            region_start, region_end = ts['start'], ts['end']
+        elif ts['end'] - region_start <= max_samples:
+            region_end = ts['end']
+        else:
+            regions.append((region_start, region_end))
+            region_start, region_end = ts['start'], ts['end']
+
+    regions.append((region_start, region_end))
+
+    overlap = int(overlap_s * frame_rate)
+    chunks = []
+
+    for chunk_index, (start, end) in enumerate(regions):
+        start = max(0, start - overlap)
+        end = min(len(samples), end + overlap)
+        chunk_path = os.path.join(output_dir, f"chunk_{chunk_index}.wav")
+        _write_wav_chunk(chunk_path, samples[start:end], frame_rate)
+        chunks.append(chunk_path)
+
+    return chunks
+
+def _split_audio_pydub(audio_path, chunk_length_ms, output_dir):
+    """Fallback chunking via pydub for non-WAV inputs"""
+    audio = AudioSegment.from_file(audio_path)
+    chunks = []
+
     # Split audio into chunks
     for i in range(0, len(audio), chunk_length_ms):
         chunk = audio[i:i + chunk_length_ms]
         chunk_path = os.path.join(output_dir, f"chunk_{i//chunk_length_ms}.wav")
         chunk.export(chunk_path, format="wav")
         chunks.append(chunk_path)
-    
+
     return chunks
\ No newline at end of file
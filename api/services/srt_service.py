@@ -1,29 +1,37 @@
 # api/services/srt_service.py - Fixed version with accurate video synchronization
 
+import functools
 import os
 import re
-from datetime import datetime, timedelta
-from faster_whisper import WhisperModel
 from pydub import AudioSegment
-import moviepy.editor as mp
 
 from api.services.whisper_functions import (
-    get_whisper_model,
     format_timestamp,
     get_video_duration,
-    get_audio_video_offset,
     generate_precise_timed_segments
 )
 
+# Tamil script detection (runs in C via the regex engine)
+_TAMIL_RE = re.compile(r'[\u0B80-\u0BFF]')
+
+# Conjunctions we avoid breaking subtitle lines at
+_BREAK_WORDS = frozenset({'and', 'or', 'but', 'so', '\u0BAE\u0BB1\u0BCD\u0BB1\u0BC1\u0BAE\u0BCD', '\u0B85\u0BB2\u0BCD\u0BB2\u0BA4\u0BC1', '\u0B86\u0BA9\u0BBE\u0BB2\u0BCD'})
+
+@functools.lru_cache(maxsize=64)
 def split_text_into_segments(text, max_chars=60, max_words=8):
-    """Split long text into smaller segments for subtitles with better readability"""
+    """Split long text into smaller segments for subtitles with better readability
+
+    Results are cached since the same text is often re-split across the
+    different alignment passes (e.g. Tanglish-Tamil and Tamil share source).
+    Returns a tuple so cached values are immutable.
+    """
     if not text:
-        return []
-    
+        return ()
+
     # Clean the text
     text = text.strip()
     if not text:
-        return []
+        return ()
     
     # Split by sentences first, handling multiple punctuation
     sentences = re.split(r'[.!?।]+(?:\s|$)', text)  # Added Tamil punctuation
@@ -33,52 +41,69 @@ def split_text_into_segments(text, max_chars=60, max_words=8):
         sentence = sentence.strip()
         if not sentence:
             continue
-            
+
         # If sentence is short enough, use as is
         if len(sentence) <= max_chars and len(sentence.split()) <= max_words:
             segments.append(sentence)
         else:
-            # Split by phrases/clauses first
+            # Split by phrases/clauses first, splitting each phrase into
+            # words once and tracking char/word counts incrementally
+            # instead of re-splitting the accumulated segment every time
             phrases = re.split(r'[,;:\n]', sentence)
-            
-            current_segment = ""
+
+            current_parts = []
+            current_chars = 0
+            current_words = 0
+
             for phrase in phrases:
                 phrase = phrase.strip()
                 if not phrase:
                     continue
-                    
-                test_segment = current_segment + " " + phrase if current_segment else phrase
-                
-                if len(test_segment) <= max_chars and len(test_segment.split()) <= max_words:
-                    current_segment = test_segment
+
+                phrase_words = phrase.split()
+                joined_chars = current_chars + len(phrase) + (1 if current_parts else 0)
+
+                if joined_chars <= max_chars and current_words + len(phrase_words) <= max_words:
+                    current_parts.append(phrase)
+                    current_chars = joined_chars
+                    current_words += len(phrase_words)
                 else:
-                    if current_segment:
-                        segments.append(current_segment)
-                    
+                    if current_parts:
+                        segments.append(' '.join(current_parts))
+                    current_parts = []
+                    current_chars = 0
+                    current_words = 0
+
                     # If phrase itself is too long, split by words
-                    if len(phrase) > max_chars or len(phrase.split()) > max_words:
-                        words = phrase.split()
-                        word_segment = ""
-                        
-                        for word in words:
-                            test_word_segment = word_segment + " " + word if word_segment else word
-                            
-                            if len(test_word_segment) <= max_chars and len(test_word_segment.split()) <= max_words:
-                                word_segment = test_word_segment
+                    if len(phrase) > max_chars or len(phrase_words) > max_words:
+                        word_parts = []
+                        word_chars = 0
+
+                        for word in phrase_words:
+                            joined_chars = word_chars + len(word) + (1 if word_parts else 0)
+
+                            if joined_chars <= max_chars and len(word_parts) < max_words:
+                                word_parts.append(word)
+                                word_chars = joined_chars
                             else:
-                                if word_segment:
-                                    segments.append(word_segment)
-                                word_segment = word
-                        
-                        if word_segment:
-                            current_segment = word_segment
+                                if word_parts:
+                                    segments.append(' '.join(word_parts))
+                                word_parts = [word]
+                                word_chars = len(word)
+
+                        if word_parts:
+                            current_parts = word_parts
+                            current_chars = word_chars
+                            current_words = len(word_parts)
                     else:
-                        current_segment = phrase
-            
-            if current_segment:
-                segments.append(current_segment)
+                        current_parts = [phrase]
+                        current_chars = len(phrase)
+                        current_words = len(phrase_words)
+
+            if current_parts:
+                segments.append(' '.join(current_parts))
     
-    return [seg.strip() for seg in segments if seg.strip()]
+    return tuple(seg.strip() for seg in segments if seg.strip())
 
 
 def create_smart_fallback_segments(audio_path, video_path, text):
@@ -98,13 +123,15 @@ def create_smart_fallback_segments(audio_path, video_path, text):
         
         print(f"Split into {len(segments)} text segments for {video_duration:.1f}s video")
         
-        # Calculate timing based on speech patterns
-        total_chars = sum(len(seg) for seg in segments)
-        total_words = sum(len(seg.split()) for seg in segments)
+        # Calculate timing based on speech patterns; split each segment into
+        # words once up front so the per-segment loop doesn't re-split
+        word_lists = [seg.split() for seg in segments]
+        total_chars = sum(map(len, segments))
+        total_words = sum(map(len, word_lists))
         
         # Estimate speech rate (characters per second)
         # Tamil speech is typically slower than English
-        is_tamil = any(ord(c) > 127 for c in text[:100])  # Check for Tamil characters
+        is_tamil = bool(_TAMIL_RE.search(text, 0, 200))  # Check for Tamil characters
         
         if is_tamil:
             chars_per_second = 6  # Slower for Tamil
@@ -122,7 +149,7 @@ def create_smart_fallback_segments(audio_path, video_path, text):
         
         for i, segment_text in enumerate(segments):
             char_count = len(segment_text)
-            word_count = len(segment_text.split())
+            word_count = len(word_lists[i])
             
             # Calculate duration based on content
             char_duration = char_count / chars_per_second
@@ -171,50 +198,74 @@ def create_smart_fallback_segments(audio_path, video_path, text):
         print(f"Error creating smart fallback segments: {e}")
         return []
 
+def _format_srt_block(subtitle_index, segment):
+    """Format one timed segment as an SRT block, or None if it's empty"""
+    text = segment['text'].strip()
+
+    if not text:  # Skip empty segments
+        return None
+
+    # Ensure proper line breaks for long text (max 2 lines)
+    if len(text) > 50:
+        words = text.split()
+        if len(words) > 6:
+            # Find best break point (try to split at middle),
+            # avoiding breaks right at a conjunction
+            mid_point = len(words) // 2
+            candidates = [i for i in range(max(1, mid_point - 2), min(len(words) - 1, mid_point + 3))
+                          if words[i-1].lower() not in _BREAK_WORDS
+                          and words[i].lower() not in _BREAK_WORDS]
+            if candidates:
+                mid_point = candidates[0]
+
+            line1 = ' '.join(words[:mid_point])
+            line2 = ' '.join(words[mid_point:])
+
+            # Ensure neither line is too long
+            if len(line1) <= 35 and len(line2) <= 35:
+                text = f"{line1}\n{line2}"
+
+    start_time = format_timestamp(segment['start'])
+    end_time = format_timestamp(segment['end'])
+    return f"{subtitle_index}\n{start_time} --> {end_time}\n{text}\n\n"
+
+def write_srt(srt_path, timed_segments):
+    """Stream timed segments to an SRT file one block at a time
+
+    Avoids materializing the whole subtitle file as a string, so peak
+    memory stays constant regardless of video length.
+
+    Returns:
+        int: Number of subtitle blocks written
+    """
+    subtitle_index = 1
+
+    with open(srt_path, "w", encoding="utf-8") as f:
+        for segment in timed_segments:
+            block = _format_srt_block(subtitle_index, segment)
+            if block is None:
+                continue
+            f.write(block)
+            subtitle_index += 1
+
+    return subtitle_index - 1
+
 def create_srt_content(timed_segments):
-    """Create SRT file content from timed segments"""
+    """Create SRT file content from timed segments as a single string"""
     if not timed_segments:
         return ""
-    
-    srt_content = ""
+
+    blocks = []
     subtitle_index = 1
-    
+
     for segment in timed_segments:
-        start_time = format_timestamp(segment['start'])
-        end_time = format_timestamp(segment['end'])
-        text = segment['text'].strip()
-        
-        if not text:  # Skip empty segments
+        block = _format_srt_block(subtitle_index, segment)
+        if block is None:
             continue
-        
-        # Ensure proper line breaks for long text (max 2 lines)
-        if len(text) > 50:
-            words = text.split()
-            if len(words) > 6:
-                # Find best break point (try to split at middle)
-                mid_point = len(words) // 2
-                # Adjust break point to avoid breaking at conjunctions
-                break_words = ['and', 'or', 'but', 'so', 'மற்றும்', 'அல்லது', 'ஆனால்']
-                
-                for i in range(max(1, mid_point-2), min(len(words)-1, mid_point+3)):
-                    if words[i-1].lower() not in break_words and words[i].lower() not in break_words:
-                        mid_point = i
-                        break
-                
-                line1 = ' '.join(words[:mid_point])
-                line2 = ' '.join(words[mid_point:])
-                
-                # Ensure neither line is too long
-                if len(line1) <= 35 and len(line2) <= 35:
-                    text = f"{line1}\n{line2}"
-        
-        srt_content += f"{subtitle_index}\n"
-        srt_content += f"{start_time} --> {end_time}\n"
-        srt_content += f"{text}\n\n"
-        
+        blocks.append(block)
         subtitle_index += 1
-    
-    return srt_content
+
+    return ''.join(blocks)
 
 def align_text_to_timing(base_timed_segments, new_text, language_hint=""):
     """Align new text to existing timing segments with better accuracy"""
@@ -312,9 +363,16 @@ def align_text_to_timing(base_timed_segments, new_text, language_hint=""):
     return aligned_segments
 
 def generate_all_srt_files_improved(upload_dir, video_path, wav_audio_path, results):
-    """Generate all SRT files with improved video synchronization"""
+    """Generate all SRT files with improved video synchronization
+
+    Contract: Whisper runs once here (for the base Tamil timing); the
+    other language tracks in `results` are expected to be derived from
+    that single pass via text-only translation/transliteration, and are
+    aligned against the shared base timing segments.
+    """
     srt_files = {}
-    
+    srt_last_ends = {}  # srt_type -> last segment end time, for duration validation
+
     try:
         print("=== Starting Enhanced SRT Generation with Video Sync ===")
         
@@ -353,12 +411,10 @@ def generate_all_srt_files_improved(upload_dir, video_path, wav_audio_path, resu
             )
             
             if tanglish_tamil_aligned_segments:
-                tanglish_tamil_srt_content = create_srt_content(tanglish_tamil_aligned_segments)
-                if tanglish_tamil_srt_content:
-                    tanglish_tamil_srt_path = os.path.join(upload_dir, "tanglish_tamil_subtitles.srt")
-                    with open(tanglish_tamil_srt_path, "w", encoding="utf-8") as f:
-                        f.write(tanglish_tamil_srt_content)
+                tanglish_tamil_srt_path = os.path.join(upload_dir, "tanglish_tamil_subtitles.srt")
+                if write_srt(tanglish_tamil_srt_path, tanglish_tamil_aligned_segments):
                     srt_files['tanglish_tamil'] = tanglish_tamil_srt_path
+                    srt_last_ends['tanglish_tamil'] = tanglish_tamil_aligned_segments[-1]['end']
                     print("✓ Generated Tanglish Tamil SRT file")
         
         # Generate SRT for English
@@ -371,12 +427,10 @@ def generate_all_srt_files_improved(upload_dir, video_path, wav_audio_path, resu
             )
             
             if english_aligned_segments:
-                english_srt_content = create_srt_content(english_aligned_segments)
-                if english_srt_content:
-                    english_srt_path = os.path.join(upload_dir, "english_subtitles.srt")
-                    with open(english_srt_path, "w", encoding="utf-8") as f:
-                        f.write(english_srt_content)
+                english_srt_path = os.path.join(upload_dir, "english_subtitles.srt")
+                if write_srt(english_srt_path, english_aligned_segments):
                     srt_files['english'] = english_srt_path
+                    srt_last_ends['english'] = english_aligned_segments[-1]['end']
                     print("✓ Generated English SRT file")
         
         # Generate SRT for Tanglish
@@ -389,12 +443,10 @@ def generate_all_srt_files_improved(upload_dir, video_path, wav_audio_path, resu
             )
             
             if tanglish_english_aligned_segments:
-                tanglish_english_srt_content = create_srt_content(tanglish_english_aligned_segments)
-                if tanglish_english_srt_content:
-                    tanglish_english_srt_path = os.path.join(upload_dir, "tanglish_english_subtitles.srt")
-                    with open(tanglish_english_srt_path, "w", encoding="utf-8") as f:
-                        f.write(tanglish_english_srt_content)
+                tanglish_english_srt_path = os.path.join(upload_dir, "tanglish_english_subtitles.srt")
+                if write_srt(tanglish_english_srt_path, tanglish_english_aligned_segments):
                     srt_files['tanglish_english'] = tanglish_english_srt_path
+                    srt_last_ends['tanglish_english'] = tanglish_english_aligned_segments[-1]['end']
                     print("✓ Generated Tanglish-English SRT file")
         
         # Generate SRT for Standard Tamil
@@ -407,31 +459,20 @@ def generate_all_srt_files_improved(upload_dir, video_path, wav_audio_path, resu
             )
             
             if tamil_aligned_segments:
-                tamil_srt_content = create_srt_content(tamil_aligned_segments)
-                if tamil_srt_content:
-                    tamil_srt_path = os.path.join(upload_dir, "tamil_subtitles.srt")
-                    with open(tamil_srt_path, "w", encoding="utf-8") as f:
-                        f.write(tamil_srt_content)
+                tamil_srt_path = os.path.join(upload_dir, "tamil_subtitles.srt")
+                if write_srt(tamil_srt_path, tamil_aligned_segments):
                     srt_files['tamil'] = tamil_srt_path
+                    srt_last_ends['tamil'] = tamil_aligned_segments[-1]['end']
                     print("✓ Generated Tamil SRT file")
         
         print(f"\n=== Successfully generated {len(srt_files)} synchronized SRT files ===")
         
-        # Validation: Check if timing makes sense
-        for srt_type, srt_path in srt_files.items():
-            with open(srt_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-                # Extract last timestamp to verify it doesn't exceed video duration
-                timestamps = re.findall(r'(\d{2}:\d{2}:\d{2},\d{3})', content)
-                if timestamps and video_duration:
-                    last_timestamp = timestamps[-1]
-                    # Convert to seconds for comparison
-                    h, m, s_ms = last_timestamp.split(':')
-                    s, ms = s_ms.split(',')
-                    last_seconds = int(h) * 3600 + int(m) * 60 + int(s) + int(ms) / 1000
-                    
-                    if last_seconds > video_duration + 1:  # Allow 1 second tolerance
-                        print(f"Warning: {srt_type} SRT extends beyond video duration ({last_seconds:.1f}s > {video_duration:.1f}s)")
+        # Validation: Check if timing makes sense using the last segment end
+        # captured during generation (no need to re-read the files)
+        if video_duration:
+            for srt_type, last_end in srt_last_ends.items():
+                if last_end > video_duration + 1:  # Allow 1 second tolerance
+                    print(f"Warning: {srt_type} SRT extends beyond video duration ({last_end:.1f}s > {video_duration:.1f}s)")
         
         return srt_files
     
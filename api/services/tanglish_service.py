@@ -1,16 +1,50 @@
 import re
+import unicodedata
+from functools import lru_cache
+
+try:
+    # Optional: when numba is installed the trie walk runs as compiled
+    # native code over a codepoint array instead of interpreted Python
+    import numpy as np
+    from numba import njit
+except ImportError:
+    njit = None
+
+# Precompiled patterns - compiling per call costs more than the match
+# itself on the short texts these helpers usually see
+_ENGLISH_RE = re.compile(r'[a-zA-Z]{3,}')
+_WS_RE = re.compile(r'\s+')
+_TAMIL_RE = re.compile(r'[஀-௿]')
+_NON_TAMIL_RUN = re.compile(r'[^஀-௿ ]+')
+# A whitespace-delimited word containing at least one Tamil character
+_TAMIL_WORD_RE = re.compile(r'\S*[஀-௿]\S*')
+
+# Emphasis suffixes like 'da'/'ah' get split off as separate words
+_SUFFIX_RES = [(re.compile(r'([a-z]+)' + word + r'\b'), r'\1 ' + word)
+               for word in ('da', 'ah', 'va', 'nga')]
+
+# These helpers also receive entire video transcripts; caching those
+# would pin megabytes of text for the process lifetime, so only short
+# inputs (single words, repeated phrases) are memoized
+_CACHE_MAX_LEN = 256
+
+@lru_cache(maxsize=1024)
+def _contains_tamil_script_cached(text):
+    return bool(_TAMIL_RE.search(text))
 
 def contains_tamil_script(text):
     """
     Check if text contains Tamil characters
-    
+
     Args:
         text (str): Text to check
-    
+
     Returns:
         bool: True if text contains Tamil script, False otherwise
     """
-    return any('\u0B80' <= c <= '\u0BFF' for c in text)
+    if len(text) <= _CACHE_MAX_LEN:
+        return _contains_tamil_script_cached(text)
+    return bool(_TAMIL_RE.search(text))
 
 def filter_non_tamil_words(text):
     """
@@ -24,257 +58,401 @@ def filter_non_tamil_words(text):
     """
     if not text:
         return ""
-    
-    # Split text into words
-    words = text.split()
-    filtered_words = []
-    
-    for word in words:
-        # Check if the word has Tamil script
-        if contains_tamil_script(word):
-            filtered_words.append(word)
-        # For words with mixed scripts, keep only Tamil parts
-        elif any('\u0B80' <= c <= '\u0BFF' for c in word):
-            tamil_chars = ''.join(c for c in word if '\u0B80' <= c <= '\u0BFF')
-            if tamil_chars:
-                filtered_words.append(tamil_chars)
-    
-    return ' '.join(filtered_words)
+
+    # One findall pass collects every word containing Tamil script, so
+    # splitting and re-probing each word in Python is no longer needed
+    return ' '.join(_TAMIL_WORD_RE.findall(text))
+
+@lru_cache(maxsize=1024)
+def _contains_english_words_cached(text):
+    return bool(_ENGLISH_RE.search(text))
 
 def contains_english_words(text):
     """
     Check for English words in Tamil text
-    
+
     Args:
         text (str): Text to check
-    
+
     Returns:
         bool: True if text contains English words, False otherwise
     """
     # Simple regex to detect English words (3+ consecutive ASCII letters)
-    english_pattern = re.compile(r'[a-zA-Z]{3,}')
-    return bool(english_pattern.search(text))
-
-def tamil_to_tanglish(text):
+    if len(text) <= _CACHE_MAX_LEN:
+        return _contains_english_words_cached(text)
+    return bool(_ENGLISH_RE.search(text))
+
+# Define mappings for Tamil characters to romanized equivalents
+
+# Tamil vowels (uyir)
+_VOWELS = {
+    'அ': 'a', 'ஆ': 'aa', 'இ': 'i', 'ஈ': 'ee',
+    'உ': 'u', 'ஊ': 'oo', 'எ': 'e', 'ஏ': 'ae',
+    'ஐ': 'ai', 'ஒ': 'o', 'ஓ': 'oa', 'ஔ': 'au'
+}
+
+# Tamil consonants (mei)
+_CONSONANTS = {
+    'க்': 'k', 'ங்': 'ng', 'ச்': 'ch', 'ஞ்': 'nj',
+    'ட்': 't', 'ண்': 'n', 'த்': 'th', 'ந்': 'n',
+    'ப்': 'p', 'ம்': 'm', 'ய்': 'y', 'ர்': 'r',
+    'ல்': 'l', 'வ்': 'v', 'ழ்': 'zh', 'ள்': 'l',
+    'ற்': 'tr', 'ன்': 'n', 'ஜ்': 'j', 'ஷ்': 'sh',
+    'ஸ்': 's', 'ஹ்': 'h'
+}
+
+# Tamil uyirmei (compound characters) - comprehensive list
+_UYIRMEI = {
+    # க family (ka)
+    'க': 'ka', 'கா': 'kaa', 'கி': 'ki', 'கீ': 'kee',
+    'கு': 'ku', 'கூ': 'koo', 'கெ': 'ke', 'கே': 'kae',
+    'கை': 'kai', 'கொ': 'ko', 'கோ': 'koa', 'கௌ': 'kau',
+
+    # ங family (nga)
+    'ங': 'nga', 'ஙா': 'ngaa', 'ஙி': 'ngi', 'ஙீ': 'ngee',
+    'ஙு': 'ngu', 'ஙூ': 'ngoo', 'ஙெ': 'nge', 'ஙே': 'ngae',
+    'ஙை': 'ngai', 'ஙொ': 'ngo', 'ஙோ': 'ngoa', 'ஙௌ': 'ngau',
+
+    # ச family (cha)
+    'ச': 'cha', 'சா': 'chaa', 'சி': 'chi', 'சீ': 'chee',
+    'சு': 'chu', 'சூ': 'choo', 'செ': 'che', 'சே': 'chae',
+    'சை': 'chai', 'சொ': 'cho', 'சோ': 'choa', 'சௌ': 'chau',
+
+    # ஞ family (nja)
+    'ஞ': 'nja', 'ஞா': 'njaa', 'ஞி': 'nji', 'ஞீ': 'njee',
+    'ஞு': 'nju', 'ஞூ': 'njoo', 'ஞெ': 'nje', 'ஞே': 'njae',
+    'ஞை': 'njai', 'ஞொ': 'njo', 'ஞோ': 'njoa', 'ஞௌ': 'njau',
+
+    # ட family (ta/da)
+    'ட': 'ta', 'டா': 'taa', 'டி': 'ti', 'டீ': 'tee',
+    'டு': 'tu', 'டூ': 'too', 'டெ': 'te', 'டே': 'tae',
+    'டை': 'tai', 'டொ': 'to', 'டோ': 'toa', 'டௌ': 'tau',
+
+    # ண family (na)
+    'ண': 'na', 'ணா': 'naa', 'ணி': 'ni', 'ணீ': 'nee',
+    'ணு': 'nu', 'ணூ': 'noo', 'ணெ': 'ne', 'ணே': 'nae',
+    'ணை': 'nai', 'ணொ': 'no', 'ணோ': 'noa', 'ணௌ': 'nau',
+
+    # த family (tha)
+    'த': 'tha', 'தா': 'thaa', 'தி': 'thi', 'தீ': 'thee',
+    'து': 'thu', 'தூ': 'thoo', 'தெ': 'the', 'தே': 'thae',
+    'தை': 'thai', 'தொ': 'tho', 'தோ': 'thoa', 'தௌ': 'thau',
+
+    # ந family (na)
+    'ந': 'na', 'நா': 'naa', 'நி': 'ni', 'நீ': 'nee',
+    'நு': 'nu', 'நூ': 'noo', 'நெ': 'ne', 'நே': 'nae',
+    'நை': 'nai', 'நொ': 'no', 'நோ': 'noa', 'நௌ': 'nau',
+
+    # ப family (pa/ba)
+    'ப': 'pa', 'பா': 'paa', 'பி': 'pi', 'பீ': 'pee',
+    'பு': 'pu', 'பூ': 'poo', 'பெ': 'pe', 'பே': 'pae',
+    'பை': 'pai', 'பொ': 'po', 'போ': 'poa', 'பௌ': 'pau',
+
+    # ம family (ma)
+    'ம': 'ma', 'மா': 'maa', 'மி': 'mi', 'மீ': 'mee',
+    'மு': 'mu', 'மூ': 'moo', 'மெ': 'me', 'மே': 'mae',
+    'மை': 'mai', 'மொ': 'mo', 'மோ': 'moa', 'மௌ': 'mau',
+
+    # ய family (ya)
+    'ய': 'ya', 'யா': 'yaa', 'யி': 'yi', 'யீ': 'yee',
+    'யு': 'yu', 'யூ': 'yoo', 'யெ': 'ye', 'யே': 'yae',
+    'யை': 'yai', 'யொ': 'yo', 'யோ': 'yoa', 'யௌ': 'yau',
+
+    # ர family (ra)
+    'ர': 'ra', 'ரா': 'raa', 'ரி': 'ri', 'ரீ': 'ree',
+    'ரு': 'ru', 'ரூ': 'roo', 'ரெ': 're', 
+    # ர family (ra) (continued)
+    'ரே': 'rae',
+    'ரை': 'rai', 'ரொ': 'ro', 'ரோ': 'roa', 'ரௌ': 'rau',
+
+    # ல family (la)
+    'ல': 'la', 'லா': 'laa', 'லி': 'li', 'லீ': 'lee',
+    'லு': 'lu', 'லூ': 'loo', 'லெ': 'le', 'லே': 'lae',
+    'லை': 'lai', 'லொ': 'lo', 'லோ': 'loa', 'லௌ': 'lau',
+
+    # வ family (va)
+    'வ': 'va', 'வா': 'vaa', 'வி': 'vi', 'வீ': 'vee',
+    'வு': 'vu', 'வூ': 'voo', 'வெ': 've', 'வே': 'vae',
+    'வை': 'vai', 'வொ': 'vo', 'வோ': 'voa', 'வௌ': 'vau',
+
+    # ழ family (zha)
+    'ழ': 'zha', 'ழா': 'zhaa', 'ழி': 'zhi', 'ழீ': 'zhee',
+    'ழு': 'zhu', 'ழூ': 'zhoo', 'ழெ': 'zhe', 'ழே': 'zhae',
+    'ழை': 'zhai', 'ழொ': 'zho', 'ழோ': 'zhoa', 'ழௌ': 'zhau',
+
+    # ள family (la)
+    'ள': 'la', 'ளா': 'laa', 'ளி': 'li', 'ளீ': 'lee',
+    'ளு': 'lu', 'ளூ': 'loo', 'ளெ': 'le', 'ளே': 'lae',
+    'ளை': 'lai', 'ளொ': 'lo', 'ளோ': 'loa', 'ளௌ': 'lau',
+
+    # ற family (tra)
+    'ற': 'tra', 'றா': 'traa', 'றி': 'tri', 'றீ': 'tree',
+    'று': 'tru', 'றூ': 'troo', 'றெ': 'tre', 'றே': 'trae',
+    'றை': 'trai', 'றொ': 'tro', 'றோ': 'troa', 'றௌ': 'trau',
+
+    # ன family (na)
+    'ன': 'na', 'னா': 'naa', 'னி': 'ni', 'னீ': 'nee',
+    'னு': 'nu', 'னூ': 'noo', 'னெ': 'ne', 'னே': 'nae',
+    'னை': 'nai', 'னொ': 'no', 'னோ': 'noa', 'னௌ': 'nau',
+
+    # ஜ family (ja)
+    'ஜ': 'ja', 'ஜா': 'jaa', 'ஜி': 'ji', 'ஜீ': 'jee',
+    'ஜு': 'ju', 'ஜூ': 'joo', 'ஜெ': 'je', 'ஜே': 'jae',
+    'ஜை': 'jai', 'ஜொ': 'jo', 'ஜோ': 'joa', 'ஜௌ': 'jau',
+
+    # ஷ family (sha)
+    'ஷ': 'sha', 'ஷா': 'shaa', 'ஷி': 'shi', 'ஷீ': 'shee',
+    'ஷு': 'shu', 'ஷூ': 'shoo', 'ஷெ': 'she', 'ஷே': 'shae',
+    'ஷை': 'shai', 'ஷொ': 'sho', 'ஷோ': 'shoa', 'ஷௌ': 'shau',
+
+    # ஸ family (sa)
+    'ஸ': 'sa', 'ஸா': 'saa', 'ஸி': 'si', 'ஸீ': 'see',
+    'ஸு': 'su', 'ஸூ': 'soo', 'ஸெ': 'se', 'ஸே': 'sae',
+    'ஸை': 'sai', 'ஸொ': 'so', 'ஸோ': 'soa', 'ஸௌ': 'sau',
+
+    # ஹ family (ha)
+    'ஹ': 'ha', 'ஹா': 'haa', 'ஹி': 'hi', 'ஹீ': 'hee',
+    'ஹு': 'hu', 'ஹூ': 'hoo', 'ஹெ': 'he', 'ஹே': 'hae',
+    'ஹை': 'hai', 'ஹொ': 'ho', 'ஹோ': 'hoa', 'ஹௌ': 'hau',
+
+    # Special characters and combinations
+    'ஃ': 'ak', 'ஸ்ரீ': 'sri',
+
+    # Special additions for common usage
+    'டா': 'da', 'டி': 'di', 'டு': 'du',  # These can sound like 'da' in spoken Tamil
+    'க்ஷ': 'ksha', 'ஶ்ரீ': 'shri'
+}
+
+# Grantha consonants (additional Tamil letters)
+_GRANTHA = {
+    'ஶ': 'sha', 'ஜ': 'ja', 'ஷ': 'sha', 'ஸ': 'sa', 'ஹ': 'ha'
+}
+
+# Common Tamil word suffixes and context-specific conversions
+_SUFFIXES = {
+    'இல்': 'il', 'இன்': 'in', 'ஆல்': 'aal',
+    'உடன்': 'udan', 'க்கு': 'kku', 'த்தில்': 'thil',
+    'ல்': 'l', 'ன்': 'n', 'ம்': 'm'
+}
+
+
+def _build_tanglish_map():
+    """Merge all mapping dicts into one, resolving precedence up front
+
+    Dicts are merged in reverse precedence order, so on key collisions
+    uyirmei wins over vowels, consonants, suffixes, grantha - the same
+    precedence the old sequential per-dict lookups had. Keys are
+    canonicalized to NFC so they match normalized input.
     """
-    Tamil to Tanglish (Romanized) conversion
-    
-    Args:
-        text (str): Tamil text
-    
-    Returns:
-        str: Romanized Tanglish text
+    merged = {}
+    for mapping in (_GRANTHA, _SUFFIXES, _CONSONANTS, _VOWELS, _UYIRMEI):
+        for key, output in mapping.items():
+            merged[unicodedata.normalize('NFC', key)] = output
+    return merged
+
+_TANGLISH_MAP = _build_tanglish_map()
+
+def _build_trie():
+    """Build a leftmost-longest-match trie over the merged mapping
+
+    Each node is a dict of next-character -> child node, with the key
+    '$' holding the romanized output for the path ending at that node.
     """
-    # Define mappings for Tamil characters to romanized equivalents
-
-    # Tamil vowels (uyir)
-    vowels = {
-        'அ': 'a', 'ஆ': 'aa', 'இ': 'i', 'ஈ': 'ee',
-        'உ': 'u', 'ஊ': 'oo', 'எ': 'e', 'ஏ': 'ae',
-        'ஐ': 'ai', 'ஒ': 'o', 'ஓ': 'oa', 'ஔ': 'au'
-    }
-
-    # Tamil consonants (mei)
-    consonants = {
-        'க்': 'k', 'ங்': 'ng', 'ச்': 'ch', 'ஞ்': 'nj',
-        'ட்': 't', 'ண்': 'n', 'த்': 'th', 'ந்': 'n',
-        'ப்': 'p', 'ம்': 'm', 'ய்': 'y', 'ர்': 'r',
-        'ல்': 'l', 'வ்': 'v', 'ழ்': 'zh', 'ள்': 'l',
-        'ற்': 'tr', 'ன்': 'n', 'ஜ்': 'j', 'ஷ்': 'sh',
-        'ஸ்': 's', 'ஹ்': 'h'
-    }
-
-    # Tamil uyirmei (compound characters) - comprehensive list
-    uyirmei = {
-        # க family (ka)
-        'க': 'ka', 'கா': 'kaa', 'கி': 'ki', 'கீ': 'kee',
-        'கு': 'ku', 'கூ': 'koo', 'கெ': 'ke', 'கே': 'kae',
-        'கை': 'kai', 'கொ': 'ko', 'கோ': 'koa', 'கௌ': 'kau',
-
-        # ங family (nga)
-        'ங': 'nga', 'ஙா': 'ngaa', 'ஙி': 'ngi', 'ஙீ': 'ngee',
-        'ஙு': 'ngu', 'ஙூ': 'ngoo', 'ஙெ': 'nge', 'ஙே': 'ngae',
-        'ஙை': 'ngai', 'ஙொ': 'ngo', 'ஙோ': 'ngoa', 'ஙௌ': 'ngau',
-
-        # ச family (cha)
-        'ச': 'cha', 'சா': 'chaa', 'சி': 'chi', 'சீ': 'chee',
-        'சு': 'chu', 'சூ': 'choo', 'செ': 'che', 'சே': 'chae',
-        'சை': 'chai', 'சொ': 'cho', 'சோ': 'choa', 'சௌ': 'chau',
-
-        # ஞ family (nja)
-        'ஞ': 'nja', 'ஞா': 'njaa', 'ஞி': 'nji', 'ஞீ': 'njee',
-        'ஞு': 'nju', 'ஞூ': 'njoo', 'ஞெ': 'nje', 'ஞே': 'njae',
-        'ஞை': 'njai', 'ஞொ': 'njo', 'ஞோ': 'njoa', 'ஞௌ': 'njau',
-
-        # ட family (ta/da)
-        'ட': 'ta', 'டா': 'taa', 'டி': 'ti', 'டீ': 'tee',
-        'டு': 'tu', 'டூ': 'too', 'டெ': 'te', 'டே': 'tae',
-        'டை': 'tai', 'டொ': 'to', 'டோ': 'toa', 'டௌ': 'tau',
-
-        # ண family (na)
-        'ண': 'na', 'ணா': 'naa', 'ணி': 'ni', 'ணீ': 'nee',
-        'ணு': 'nu', 'ணூ': 'noo', 'ணெ': 'ne', 'ணே': 'nae',
-        'ணை': 'nai', 'ணொ': 'no', 'ணோ': 'noa', 'ணௌ': 'nau',
-
-        # த family (tha)
-        'த': 'tha', 'தா': 'thaa', 'தி': 'thi', 'தீ': 'thee',
-        'து': 'thu', 'தூ': 'thoo', 'தெ': 'the', 'தே': 'thae',
-        'தை': 'thai', 'தொ': 'tho', 'தோ': 'thoa', 'தௌ': 'thau',
-
-        # ந family (na)
-        'ந': 'na', 'நா': 'naa', 'நி': 'ni', 'நீ': 'nee',
-        'நு': 'nu', 'நூ': 'noo', 'நெ': 'ne', 'நே': 'nae',
-        'நை': 'nai', 'நொ': 'no', 'நோ': 'noa', 'நௌ': 'nau',
-
-        # ப family (pa/ba)
-        'ப': 'pa', 'பா': 'paa', 'பி': 'pi', 'பீ': 'pee',
-        'பு': 'pu', 'பூ': 'poo', 'பெ': 'pe', 'பே': 'pae',
-        'பை': 'pai', 'பொ': 'po', 'போ': 'poa', 'பௌ': 'pau',
-
-        # ம family (ma)
-        'ம': 'ma', 'மா': 'maa', 'மி': 'mi', 'மீ': 'mee',
-        'மு': 'mu', 'மூ': 'moo', 'மெ': 'me', 'மே': 'mae',
-        'மை': 'mai', 'மொ': 'mo', 'மோ': 'moa', 'மௌ': 'mau',
-
-        # ய family (ya)
-        'ய': 'ya', 'யா': 'yaa', 'யி': 'yi', 'யீ': 'yee',
-        'யு': 'yu', 'யூ': 'yoo', 'யெ': 'ye', 'யே': 'yae',
-        'யை': 'yai', 'யொ': 'yo', 'யோ': 'yoa', 'யௌ': 'yau',
-
-        # ர family (ra)
-        'ர': 'ra', 'ரா': 'raa', 'ரி': 'ri', 'ரீ': 'ree',
-        'ரு': 'ru', 'ரூ': 'roo', 'ரெ': 're', 
-        # ர family (ra) (continued)
-        'ரே': 'rae',
-        'ரை': 'rai', 'ரொ': 'ro', 'ரோ': 'roa', 'ரௌ': 'rau',
-
-        # ல family (la)
-        'ல': 'la', 'லா': 'laa', 'லி': 'li', 'லீ': 'lee',
-        'லு': 'lu', 'லூ': 'loo', 'லெ': 'le', 'லே': 'lae',
-        'லை': 'lai', 'லொ': 'lo', 'லோ': 'loa', 'லௌ': 'lau',
-
-        # வ family (va)
-        'வ': 'va', 'வா': 'vaa', 'வி': 'vi', 'வீ': 'vee',
-        'வு': 'vu', 'வூ': 'voo', 'வெ': 've', 'வே': 'vae',
-        'வை': 'vai', 'வொ': 'vo', 'வோ': 'voa', 'வௌ': 'vau',
-
-        # ழ family (zha)
-        'ழ': 'zha', 'ழா': 'zhaa', 'ழி': 'zhi', 'ழீ': 'zhee',
-        'ழு': 'zhu', 'ழூ': 'zhoo', 'ழெ': 'zhe', 'ழே': 'zhae',
-        'ழை': 'zhai', 'ழொ': 'zho', 'ழோ': 'zhoa', 'ழௌ': 'zhau',
-
-        # ள family (la)
-        'ள': 'la', 'ளா': 'laa', 'ளி': 'li', 'ளீ': 'lee',
-        'ளு': 'lu', 'ளூ': 'loo', 'ளெ': 'le', 'ளே': 'lae',
-        'ளை': 'lai', 'ளொ': 'lo', 'ளோ': 'loa', 'ளௌ': 'lau',
-
-        # ற family (tra)
-        'ற': 'tra', 'றா': 'traa', 'றி': 'tri', 'றீ': 'tree',
-        'று': 'tru', 'றூ': 'troo', 'றெ': 'tre', 'றே': 'trae',
-        'றை': 'trai', 'றொ': 'tro', 'றோ': 'troa', 'றௌ': 'trau',
-
-        # ன family (na)
-        'ன': 'na', 'னா': 'naa', 'னி': 'ni', 'னீ': 'nee',
-        'னு': 'nu', 'னூ': 'noo', 'னெ': 'ne', 'னே': 'nae',
-        'னை': 'nai', 'னொ': 'no', 'னோ': 'noa', 'னௌ': 'nau',
-
-        # ஜ family (ja)
-        'ஜ': 'ja', 'ஜா': 'jaa', 'ஜி': 'ji', 'ஜீ': 'jee',
-        'ஜு': 'ju', 'ஜூ': 'joo', 'ஜெ': 'je', 'ஜே': 'jae',
-        'ஜை': 'jai', 'ஜொ': 'jo', 'ஜோ': 'joa', 'ஜௌ': 'jau',
-
-        # ஷ family (sha)
-        'ஷ': 'sha', 'ஷா': 'shaa', 'ஷி': 'shi', 'ஷீ': 'shee',
-        'ஷு': 'shu', 'ஷூ': 'shoo', 'ஷெ': 'she', 'ஷே': 'shae',
-        'ஷை': 'shai', 'ஷொ': 'sho', 'ஷோ': 'shoa', 'ஷௌ': 'shau',
-
-        # ஸ family (sa)
-        'ஸ': 'sa', 'ஸா': 'saa', 'ஸி': 'si', 'ஸீ': 'see',
-        'ஸு': 'su', 'ஸூ': 'soo', 'ஸெ': 'se', 'ஸே': 'sae',
-        'ஸை': 'sai', 'ஸொ': 'so', 'ஸோ': 'soa', 'ஸௌ': 'sau',
-
-        # ஹ family (ha)
-        'ஹ': 'ha', 'ஹா': 'haa', 'ஹி': 'hi', 'ஹீ': 'hee',
-        'ஹு': 'hu', 'ஹூ': 'hoo', 'ஹெ': 'he', 'ஹே': 'hae',
-        'ஹை': 'hai', 'ஹொ': 'ho', 'ஹோ': 'hoa', 'ஹௌ': 'hau',
-
-        # Special characters and combinations
-        'ஃ': 'ak', 'ஸ்ரீ': 'sri',
-
-        # Special additions for common usage
-        'டா': 'da', 'டி': 'di', 'டு': 'du',  # These can sound like 'da' in spoken Tamil
-        'க்ஷ': 'ksha', 'ஶ்ரீ': 'shri'
-    }
-
-    # Grantha consonants (additional Tamil letters)
-    grantha = {
-        'ஶ': 'sha', 'ஜ': 'ja', 'ஷ': 'sha', 'ஸ': 'sa', 'ஹ': 'ha'
-    }
-
-    # Common Tamil word suffixes and context-specific conversions
-    suffixes = {
-        'இல்': 'il', 'இன்': 'in', 'ஆல்': 'aal',
-        'உடன்': 'udan', 'க்கு': 'kku', 'த்தில்': 'thil',
-        'ல்': 'l', 'ன்': 'n', 'ம்': 'm'
-    }
-
-    # Convert Tamil text to Tanglish
-    result = ""
+    trie = {}
+    for key, output in _TANGLISH_MAP.items():
+        node = trie
+        for char in key:
+            node = node.setdefault(char, {})
+        node['$'] = output
+    return trie
+
+_TRIE = _build_trie()
+
+# Longest match the original sequential lookup could see: it probed
+# substrings of length 4 down to 1, so the lone longer key ('த்தில்')
+# was unreachable. The walk honours the same cap to keep output
+# identical to the pre-trie implementation.
+_MAX_MATCH = 4
+
+def _walk_trie_python(text):
+    """Transliterate via the dict trie, returning output pieces"""
+    out = []
     i = 0
-
-    while i < len(text):
-        # Try to match the longest character combinations first
-        found = False
-        for length in range(min(4, len(text) - i), 0, -1):
-            substring = text[i:i+length]
-
-            # Check if the substring exists in our mappings
-            if substring in uyirmei:
-                result += uyirmei[substring]
-                i += length
-                found = True
-                break
-            elif substring in vowels:
-                result += vowels[substring]
-                i += length
-                found = True
-                break
-            elif substring in consonants:
-                result += consonants[substring]
-                i += length
-                found = True
-                break
-            elif substring in suffixes:
-                result += suffixes[substring]
-                i += length
-                found = True
-                break
-            elif substring in grantha:
-                result += grantha[substring]
-                i += length
-                found = True
+    n = len(text)
+
+    while i < n:
+        # Non-Tamil runs (English words, punctuation) can never match a
+        # mapping, so copy the whole run in one C-level regex hop
+        # instead of failing a trie walk per character
+        m = _NON_TAMIL_RUN.match(text, i)
+        if m:
+            out.append(m.group())
+            i = m.end()
+            continue
+
+        node = _TRIE
+        j = i
+        match_end = -1
+        match_output = None
+
+        while j < n and j - i < _MAX_MATCH:
+            node = node.get(text[j])
+            if node is None:
                 break
+            j += 1
+            output = node.get('$')
+            if output is not None:
+                match_end = j
+                match_output = output
+
+        if match_output is not None:
+            out.append(match_output)
+            i = match_end
+            continue
 
         # If no match found, keep the character as is
-        if not found:
-            # Add a space between words
-            if text[i] == ' ':
-                result += ' '
-            # Special case for Tamil pulli (virama)
-            elif text[i] == '்':
-                # Do nothing, it's handled by the consonant mappings
+        # Add a space between words
+        if text[i] == ' ':
+            out.append(' ')
+        # Special case for Tamil pulli (virama)
+        elif text[i] == '்':
+            # Do nothing, it's handled by the consonant mappings
+            pass
+        # For English or other characters, just add them as is
+        elif ord(text[i]) < 0x0B80 or ord(text[i]) > 0x0BFF:
+            out.append(text[i])
+        # If we missed any Tamil character, add a placeholder
+        else:
+            out.append('?')
+        i += 1
+
+    return out
+
+def _build_dfa(trie):
+    """Flatten the trie into int32 transition tables for the JIT walk
+
+    Returns (char_index, next_state, output_id, outputs): char_index maps
+    a code point to a dense alphabet index (-1 = not in any key),
+    next_state[state, char] is the DFA transition (-1 = miss) and
+    output_id[state] indexes into outputs for accepting states.
+    """
+    nodes = [trie]
+    node_index = {id(trie): 0}
+    for node in nodes:
+        for char, child in node.items():
+            if char != '$' and id(child) not in node_index:
+                node_index[id(child)] = len(nodes)
+                nodes.append(child)
+
+    alphabet = sorted({char for node in nodes for char in node if char != '$'})
+    char_index = np.full(0x0C00, -1, dtype=np.int32)
+    for k, char in enumerate(alphabet):
+        char_index[ord(char)] = k
+
+    next_state = np.full((len(nodes), len(alphabet)), -1, dtype=np.int32)
+    output_id = np.full(len(nodes), -1, dtype=np.int32)
+    outputs = []
+
+    for state, node in enumerate(nodes):
+        for char, child in node.items():
+            if char == '$':
+                output_id[state] = len(outputs)
+                outputs.append(child)
+            else:
+                next_state[state, char_index[ord(char)]] = node_index[id(child)]
+
+    return char_index, next_state, output_id, outputs
+
+if njit is not None:
+    _DFA_CHAR_INDEX, _DFA_NEXT_STATE, _DFA_OUTPUT_ID, _DFA_OUTPUTS = _build_dfa(_TRIE)
+
+    @njit(cache=True)
+    def _walk_dfa(codepoints, char_index, next_state, output_id):
+        """Leftmost-longest DFA walk over a codepoint array
+
+        Emits (type, value) token pairs: type 0 = mapping output id,
+        type 1 = literal code point, type 2 = '?' placeholder. The Tamil
+        pulli and trailing-mismatch semantics mirror _walk_trie_python.
+        """
+        n = codepoints.shape[0]
+        token_types = np.empty(n, dtype=np.int32)
+        token_values = np.empty(n, dtype=np.int32)
+        count = 0
+        i = 0
+
+        while i < n:
+            state = 0
+            j = i
+            match_end = -1
+            match_output = -1
+
+            while j < n and j - i < _MAX_MATCH:
+                cp = codepoints[j]
+                k = char_index[cp] if 0 <= cp < char_index.shape[0] else -1
+                if k < 0:
+                    break
+                state = next_state[state, k]
+                if state < 0:
+                    break
+                j += 1
+                if output_id[state] >= 0:
+                    match_end = j
+                    match_output = output_id[state]
+
+            if match_output >= 0:
+                token_types[count] = 0
+                token_values[count] = match_output
+                count += 1
+                i = match_end
+                continue
+
+            cp = codepoints[i]
+            if cp == 0x0BCD:  # pulli, handled by the consonant mappings
                 pass
-            # For English or other characters, just add them as is
-            elif ord(text[i]) < 0x0B80 or ord(text[i]) > 0x0BFF:
-                result += text[i]
-            # If we missed any Tamil character, add a placeholder
+            elif cp < 0x0B80 or cp > 0x0BFF:
+                token_types[count] = 1
+                token_values[count] = cp
+                count += 1
             else:
-                result += '?'
+                token_types[count] = 2
+                token_values[count] = 0
+                count += 1
             i += 1
 
+        return token_types, token_values, count
+
+    def _walk_trie(text):
+        codepoints = np.frombuffer(text.encode('utf-32-le'), dtype=np.int32)
+        token_types, token_values, count = _walk_dfa(
+            codepoints, _DFA_CHAR_INDEX, _DFA_NEXT_STATE, _DFA_OUTPUT_ID)
+
+        out = []
+        for idx in range(count):
+            token_type = token_types[idx]
+            if token_type == 0:
+                out.append(_DFA_OUTPUTS[token_values[idx]])
+            elif token_type == 1:
+                out.append(chr(token_values[idx]))
+            else:
+                out.append('?')
+        return out
+else:
+    _walk_trie = _walk_trie_python
+
+def _convert_tamil_to_tanglish(text):
+    """Run the trie walk and post-processing (no caching)"""
+    # Normalize to NFC so decomposed base+vowel-sign sequences compare
+    # equal to the precomposed mapping keys instead of falling through
+    # to the '?' placeholder branch
+    text = unicodedata.normalize('NFC', text)
+
+    # Convert Tamil text to Tanglish by walking the precompiled trie,
+    # emitting the longest mapping that matches at each position
+    result = ''.join(_walk_trie(text))
+
     # Post-processing to clean up the text
     # Fix double spaces and other formatting issues
-    result = re.sub(r'\s+', ' ', result).strip()
+    result = _WS_RE.sub(' ', result).strip()
 
     # Handle common spoken forms for better readability
     # Convert some patterns to match colloquial Tanglish
@@ -282,9 +460,28 @@ def tamil_to_tanglish(text):
     result = result.replace('ka ', 'ga ').replace('pa ', 'ba ')
 
     # Handle common suffixes 'da' and 'ah' for emphasis
-    for word in ['da', 'ah', 'va', 'nga']:
-        pattern = r'([a-z]+)' + word + r'\b'
-        replacement = r'\1 ' + word
-        result = re.sub(pattern, replacement, result)
+    for pattern, replacement in _SUFFIX_RES:
+        result = pattern.sub(replacement, result)
+
+    return result
 
-    return result
\ No newline at end of file
+_tamil_to_tanglish_cached = lru_cache(maxsize=1024)(_convert_tamil_to_tanglish)
+
+def tamil_to_tanglish(text):
+    """
+    Tamil to Tanglish (Romanized) conversion
+
+    Repeated short phrases (chorus lines, stock phrases) are served
+    from an LRU cache instead of re-running the trie walk and
+    post-processing; full transcripts bypass the cache so it stays
+    bounded in bytes, not just entries.
+
+    Args:
+        text (str): Tamil text
+
+    Returns:
+        str: Romanized Tanglish text
+    """
+    if len(text) <= _CACHE_MAX_LEN:
+        return _tamil_to_tanglish_cached(text)
+    return _convert_tamil_to_tanglish(text)
\ No newline at end of file
@@ -1,40 +1,57 @@
 import time
 from googletrans import Translator
 
+# Shared client - constructing a Translator per call pays a fresh
+# connection/TLS setup every time
+_translator = Translator()
+
+_MAX_RETRIES = 3
+
+def translate_texts(texts, source_lang, target_lang):
+    """
+    Translate a batch of texts in a single Google Translate request
+
+    Args:
+        texts (list): Texts to translate
+        source_lang (str): Source language code
+        target_lang (str): Target language code
+
+    Returns:
+        list: Translated texts, aligned with the input order
+    """
+    if not texts:
+        return []
+
+    # For 'auto' language detection, use None instead
+    src = None if source_lang == "auto" else source_lang
+
+    for attempt in range(_MAX_RETRIES):
+        try:
+            translations = _translator.translate(list(texts), src=src, dest=target_lang)
+            if not isinstance(translations, list):
+                translations = [translations]
+            return [translation.text for translation in translations]
+        except Exception as e:
+            print(f"Translation error: {str(e)}")
+            # Back off only when a request failed (e.g. rate limiting),
+            # with exponentially growing delays
+            time.sleep(min(2 ** attempt, 8))
+
+    return [f"Translation failed: {text[:100]}..." for text in texts]
+
 def translate_text(text, source_lang, target_lang):
     """
     Translate text using Google Translate
-    
+
     Args:
         text (str): Text to translate
         source_lang (str): Source language code
         target_lang (str): Target language code
-    
+
     Returns:
         str: Translated text
     """
     if not text:
         return ""
 
-    translator = Translator()
-
-    # Add a small delay to avoid rate limiting
-    time.sleep(1)
-
-    try:
-        # For 'auto' language detection, use None instead
-        src = None if source_lang == "auto" else source_lang
-        translation = translator.translate(text, src=src, dest=target_lang)
-        return translation.text
-    except Exception as e:
-        print(f"Translation error: {str(e)}")
-        # Try one more time with a delay
-        time.sleep(2)
-        try:
-            # Use None explicitly for auto-detection
-            src = None if source_lang == "auto" else source_lang
-            translation = translator.translate(text, src=src, dest=target_lang)
-            return translation.text
-        except Exception as e:
-            print(f"Translation failed again: {str(e)}")
-            return f"Translation failed: {text[:100]}..."
\ No newline at end of file
+    return translate_texts([text], source_lang, target_lang)[0]
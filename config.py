@@ -1,12 +1,16 @@
 import os
 
+# Resolved once at first import; later imports come from sys.modules,
+# so nothing here is re-evaluated per worker request
+_BASE_DIR = os.path.abspath(os.path.dirname(__file__))
+
 class Config:
     SECRET_KEY = os.environ.get('SECRET_KEY') or 'dev-secret-key'
     DEBUG = os.environ.get('DEBUG') or False
     HOST = os.environ.get('HOST') or '0.0.0.0'
-    PORT = int(7860)
-    
+    PORT = 7860
+
     # File upload settings
-    UPLOAD_FOLDER = os.path.join(os.path.abspath(os.path.dirname(__file__)), 'static/temp')
+    UPLOAD_FOLDER = os.path.join(_BASE_DIR, 'static/temp')
     MAX_CONTENT_LENGTH = 100 * 1024 * 1024  # 100MB max upload size
-    ALLOWED_EXTENSIONS = {'mp4', 'avi', 'mov', 'wmv', 'mkv'}
\ No newline at end of file
+    ALLOWED_EXTENSIONS = frozenset({'mp4', 'avi', 'mov', 'wmv', 'mkv'})